@@ -1,34 +1,44 @@
 # preprocess_cities.py
-import json
-import re
+import os
+from pathlib import Path
+
+import ijson
 
 INPUT_FILE = "city_list.json"
 OUTPUT_FILE = "locations.txt"
 
-valid_name = re.compile(r"[A-Za-zÀ-ÿ]")  # allow accented letters
-
-unique = set()
-
-with open(INPUT_FILE, "r", encoding="utf-8") as f:
-    cities = json.load(f)
-
-for city in cities:
-    name = city.get("name", "").strip()
-    country = city.get("country", "").strip()
 
-    # skip invalid entries
-    if not name or not country:
-        continue
-    if not valid_name.search(name):  # must contain letters
-        continue
-    if len(name) < 2:
-        continue
+def has_letter(name):
+    # letters up to U+00FF, matching the [A-Za-zÀ-ÿ] class weatherApp.py validates with
+    return any(ch.isalpha() and ch <= "ÿ" for ch in name)
 
-    display = f"{name},{country}"
-    unique.add(display)
 
-with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-    for city in sorted(unique):
-        f.write(city + "\n")
+# stream entries one at a time instead of materialising the whole list in memory
+# skip invalid entries: needs a name and country, 2+ chars, and must contain letters
+# each location keeps an OpenWeather city id so the app can batch requests by id,
+# but only when the name is unambiguous. The app looks ids up case-insensitively,
+# so ambiguity is judged on the lowercased name; None marks names shared by several cities
+unique = set()
+ids = {}
+with open(INPUT_FILE, "rb") as f:
+    for city in ijson.items(f, "item"):
+        name = city.get("name", "").strip()
+        country = city.get("country", "").strip()
+        if not name or not country or len(name) < 2 or not has_letter(name):
+            continue
+        display = f"{name},{country}"
+        key = display.lower()
+        city_id = int(city["id"])  # a few ids are stored as floats
+        unique.add(display)
+        ids[key] = city_id if ids.get(key, city_id) == city_id else None
+
+# write to a temp file and swap it in, so the app never loads a half-written list
+data = "\n".join(
+    display if (city_id := ids[display.lower()]) is None else f"{display}\t{city_id}"
+    for display in sorted(unique)
+) + "\n"
+tmp = OUTPUT_FILE + ".tmp"
+Path(tmp).write_text(data, encoding="utf-8")
+os.replace(tmp, OUTPUT_FILE)
 
 print(f"Cleaned locations.txt created with {len(unique)} entries")
@@ -1,35 +1,138 @@
 import sys
 import os
-from datetime import datetime, timezone, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QCompleter,
     QLabel, QLineEdit, QPushButton, QMessageBox, QSizePolicy, QGridLayout, 
-    QScrollArea, QFrame, QListWidget, QListWidgetItem
+    QScrollArea, QFrame
 )
 from PyQt6.QtGui import QPixmap, QFont
-from PyQt6.QtCore import Qt, QStringListModel, QObject, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QStringListModel, QObject, QTimer, pyqtSignal
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
+from cachetools import TTLCache
 
 ICON_SIZE = 100
+CARD_ICON_SIZE = 64
+
+# Accepted location format: "City,CC"
+_LOC_RE = re.compile(r"^[A-Za-zÀ-ÿ\s\-']+,\s*[A-Z]{2}$")
+
+# OpenWeather's group endpoint accepts at most this many city ids per call
+GROUP_LIMIT = 20
+
+# Shared HTTP session so icon and weather requests reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "weatherApp/1.0"})
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
+# One worker pool for the whole app; requests are I/O bound so a few threads cover a batch
+_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+# Weather icons: process-wide memo in front of a persistent on-disk cache
+_ICON_MEM_CACHE: dict[str, QPixmap] = {}
+_ICON_CACHE_DIR = Path.home() / ".cache" / "weatherApp" / "icons"
+# Smooth-scaled icons keyed by (icon_code, size); QPixmap is implicitly shared
+_SCALED_ICON_CACHE: dict[tuple[str, int], QPixmap] = {}
+
+
+def location_key(city):
+    """Normalise "London, gb" and "London,GB" to the same lookup key."""
+    name, _, country = city.partition(",")
+    return f"{name.strip()},{country.strip()}".lower()
+
+
+def qt_fold(text):
+    """Sort key matching Qt's case-insensitive QString::compare (one-to-one case folding).
+
+    str.lower() agrees except where it expands a character, e.g. "İ" -> "i̇"; Qt leaves
+    those unchanged, so they are kept as-is here too.
+    """
+    folded = text.lower()
+    if len(folded) == len(text):
+        return folded
+    return "".join(ch if len(low := ch.lower()) != 1 else low for ch in text)
+
+
+class IconLoader(QObject):
+    """Downloads each icon once; the PNG is decoded a single time and shared by every waiting card."""
+    loaded = pyqtSignal(str, bytes)
+
+    def __init__(self):
+        super().__init__()
+        self.pending = {}  # icon_code -> cards waiting on the in-flight download
+        self.loaded.connect(self.on_loaded)
+
+    def request(self, icon_code, card):
+        waiting = self.pending.get(icon_code)
+        if waiting is not None:
+            waiting.append(card)
+            return
+        self.pending[icon_code] = [card]
+        _EXECUTOR.submit(self.fetch, icon_code)
+
+    def fetch(self, icon_code):
+        # Runs on the worker pool, so only raw bytes are handed back to the GUI thread
+        url = f"https://openweathermap.org/img/wn/{icon_code}@2x.png"
+        try:
+            response = _SESSION.get(url, timeout=5)
+            response.raise_for_status()
+        except requests.RequestException:
+            self.loaded.emit(icon_code, b"")  # still clear the pending entry
+            return
+        try:
+            _ICON_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            (_ICON_CACHE_DIR / f"{icon_code}.png").write_bytes(response.content)
+        except OSError:
+            pass  # disk cache is best-effort
+        self.loaded.emit(icon_code, response.content)
+
+    def on_loaded(self, icon_code, img_data):
+        cards = self.pending.pop(icon_code, [])
+        pixmap = QPixmap()
+        if not img_data or not pixmap.loadFromData(img_data):
+            return
+        _ICON_MEM_CACHE[icon_code] = pixmap
+        for card in cards:
+            try:
+                card.set_icon(icon_code, pixmap)
+            except RuntimeError:
+                pass  # card was destroyed before the icon arrived
+
+
+_ICON_LOADER = IconLoader()
+
 
 class WeatherCard(QFrame):
+
+    # Shared by every card; built on first use since QFont needs a running QApplication
+    HEADER_FONT = None
+    TEMP_FONT = None
+    STAT_FONT = None
+
     def __init__(self, data, unit_symbol, unit):
         super().__init__()
 
+        if WeatherCard.HEADER_FONT is None:
+            WeatherCard.HEADER_FONT = QFont("Arial", 16, QFont.Weight.Bold)
+            WeatherCard.TEMP_FONT = QFont("Arial", 24, QFont.Weight.Bold)
+            WeatherCard.STAT_FONT = QFont("Arial", 9)
+
         self.unit_symbol = unit_symbol
         self.unit = unit
         self.data = data
 
+        # Card styling lives in WeatherApp.apply_styles so the QSS is parsed once
         self.setObjectName("WeatherCard")
-        self.setStyleSheet("""
-            QFrame#WeatherCard {
-                background-color: #EBD5AB;
-                border-radius: 12px;
-                border: 5px solid #628141;
-                color: #1B211A;
-            }
-        """)
 
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
 
@@ -44,8 +147,8 @@ class WeatherCard(QFrame):
         city = self.data.get("name", "N/A")
         country = self.data.get("sys", {}).get("country", "")
         header = QLabel(f"📍 {city}, {country}")
-        header.setFont(QFont("Arial", 16, QFont.Weight.Bold))
-        header.setStyleSheet("color: #1B211A")
+        header.setFont(WeatherCard.HEADER_FONT)
+        header.setProperty("role", "primary")
 
         main.addWidget(header)
 
@@ -53,28 +156,33 @@ class WeatherCard(QFrame):
         hero = QHBoxLayout()
         hero.setSpacing(10)
 
-        icon = QLabel()
+        # Placeholder keeps the layout stable until a fetched icon arrives
+        self.icon_label = QLabel()
+        self.icon_label.setFixedSize(CARD_ICON_SIZE, CARD_ICON_SIZE)
         icon_code = self.data["weather"][0].get("icon", "")
         pixmap = self.load_weather_icon(icon_code)
         if pixmap:
-            icon.setPixmap(pixmap.scaled(
-                64, 64,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            ))
+            self.set_icon(icon_code, pixmap)
 
-        temp = QLabel(f"{self.data['main']['temp']:.1f}{self.unit_symbol}")
-        temp.setFont(QFont("Arial", 24, QFont.Weight.Bold))
-        temp.setStyleSheet("color: #1B211A")
+        # Data is always fetched in metric; imperial is derived here
+        temp_value = self.data["main"]["temp"]
+        wind_speed = self.data["wind"]["speed"]
+        if self.unit == "imperial":
+            temp_value = temp_value * 9 / 5 + 32
+            wind_speed = round(wind_speed * 2.2369, 2)
+
+        temp = QLabel(f"{temp_value:.1f}{self.unit_symbol}")
+        temp.setFont(WeatherCard.TEMP_FONT)
+        temp.setProperty("role", "primary")
 
         desc = QLabel(self.data["weather"][0]["description"].capitalize())
-        desc.setStyleSheet("color: #628141")
+        desc.setProperty("role", "desc")
 
         temp_col = QVBoxLayout()
         temp_col.addWidget(temp)
         temp_col.addWidget(desc)
 
-        hero.addWidget(icon)
+        hero.addWidget(self.icon_label)
         hero.addLayout(temp_col)
         hero.addStretch()
 
@@ -83,7 +191,7 @@ class WeatherCard(QFrame):
         # ─── Divider ───
         line = QFrame()
         line.setFrameShape(QFrame.Shape.HLine)
-        line.setStyleSheet("color: #628141")
+        line.setProperty("role", "divider")
         main.addWidget(line)
 
         # ─── Stats (compact) ───
@@ -92,19 +200,20 @@ class WeatherCard(QFrame):
         stats.setVerticalSpacing(4)
 
         wind_unit = "m/s" if self.unit == "metric" else "mph"
-        tz_offset = self.data.get("timezone", 0)
+        # The group endpoint reports the offset under "sys" instead of the top level
+        tz_offset = self.data.get("timezone", self.data["sys"].get("timezone", 0))
 
         sunrise = self.convert_unix_to_local_time(self.data["sys"]["sunrise"], tz_offset)
         sunset = self.convert_unix_to_local_time(self.data["sys"]["sunset"], tz_offset)
 
         def stat(text):
             lbl = QLabel(text)
-            lbl.setFont(QFont("Arial", 9))
-            lbl.setStyleSheet("color: #1B211A")
+            lbl.setFont(WeatherCard.STAT_FONT)
+            lbl.setProperty("role", "stat")
             return lbl
 
         stats.addWidget(stat(f"💧 {self.data['main']['humidity']}%"), 0, 0)
-        stats.addWidget(stat(f"🌬 {self.data['wind']['speed']} {wind_unit}"), 0, 1)
+        stats.addWidget(stat(f"🌬 {wind_speed} {wind_unit}"), 0, 1)
         stats.addWidget(stat(f"📊 {self.data['main']['pressure']} hPa"), 1, 0)
         stats.addWidget(stat(f"🌅 {sunrise}"), 1, 1)
         stats.addWidget(stat(f"🌇 {sunset}"), 2, 0)
@@ -113,56 +222,37 @@ class WeatherCard(QFrame):
 
     # ───── Helpers (unchanged logic) ─────
     def load_weather_icon(self, icon_code):
+        """Return a cached icon, or None after queueing a background download."""
         if not icon_code:
             return None
-        url = f"https://openweathermap.org/img/wn/{icon_code}@2x.png"
-        try:
-            response = requests.get(url, timeout=5)
-            response.raise_for_status()
-            pixmap = QPixmap()
-            pixmap.loadFromData(response.content)
-            return pixmap
-        except requests.RequestException:
-            return None
-
-    def convert_unix_to_local_time(self, unix_ts: int, offset_seconds: int) -> str:
-        utc_time = datetime.fromtimestamp(unix_ts, tz=timezone.utc)
-        local_time = utc_time + timedelta(seconds=offset_seconds)
-        return local_time.strftime("%H:%M")
-
-class CityInput(QLineEdit):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.suggestion_list = None
-
-    def set_suggestion_list(self, list_widget):
-        self.suggestion_list = list_widget
+        if icon_code in _ICON_MEM_CACHE:
+            return _ICON_MEM_CACHE[icon_code]
 
-    def keyPressEvent(self, event):
-        if self.suggestion_list and self.suggestion_list.isVisible():
-            key = event.key()
-
-            if key == Qt.Key.Key_Down:
-                row = self.suggestion_list.currentRow()
-                self.suggestion_list.setCurrentRow(row + 1)
-                return
-
-            elif key == Qt.Key.Key_Up:
-                row = self.suggestion_list.currentRow()
-                self.suggestion_list.setCurrentRow(max(0, row - 1))
-                return
+        pixmap = QPixmap()
+        path = _ICON_CACHE_DIR / f"{icon_code}.png"
+        if path.exists() and pixmap.load(str(path)):
+            _ICON_MEM_CACHE[icon_code] = pixmap
+            return pixmap
 
-            elif key in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
-                item = self.suggestion_list.currentItem()
-                if item:
-                    self.parent().insert_suggestion(item)
-                return
+        _ICON_LOADER.request(icon_code, self)
+        return None
 
-            elif key == Qt.Key.Key_Escape:
-                self.suggestion_list.hide()
-                return
+    def set_icon(self, icon_code, pixmap):
+        key = (icon_code, CARD_ICON_SIZE)
+        scaled = _SCALED_ICON_CACHE.get(key)
+        if scaled is None:
+            scaled = pixmap.scaled(
+                CARD_ICON_SIZE, CARD_ICON_SIZE,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+            _SCALED_ICON_CACHE[key] = scaled
+        self.icon_label.setPixmap(scaled)
 
-        super().keyPressEvent(event)
+    def convert_unix_to_local_time(self, unix_ts: int, offset_seconds: int) -> str:
+        # Same as datetime(...).strftime("%H:%M") without building datetime objects
+        t = unix_ts + offset_seconds
+        return f"{(t // 3600) % 24:02d}:{(t // 60) % 60:02d}"
 
 class WeatherApp(QWidget):
     def __init__(self):
@@ -177,8 +267,9 @@ class WeatherApp(QWidget):
             if os.path.exists(env_path):
                 with open(env_path, "r", encoding="utf-8") as ef:
                     for line in ef:
-                        if line.strip().startswith("OPENWEATHER_API_KEY="):
-                            self.api_key = line.split("=", 1)[1].strip().strip('"').strip("'")
+                        key, eq, value = line.partition("=")
+                        if eq and key.strip() == "OPENWEATHER_API_KEY":
+                            self.api_key = value.strip().strip('"').strip("'")
                             break
 
         if not self.api_key:
@@ -186,13 +277,27 @@ class WeatherApp(QWidget):
             sys.exit(1)
         self.unit = "metric"
         self.unit_symbol = "°C"
-        self.cache = {}
-
+        # Metric responses keyed by location_key(); entries expire after 10 minutes
+        self.cache = TTLCache(maxsize=256, ttl=600)
+
+        # locations.txt lines are "City,CC<TAB>id"; the id enables batched group requests and
+        # is left out for names shared by several cities, which are then fetched by name.
+        # Lines without a numeric id are kept as names only.
+        self.cities = []
+        self.city_ids = {}
         try:
-            with open("locations.txt", "r", encoding="utf-8") as f:
-                self.cities = [line.strip() for line in f if line.strip()]
+            lines = Path("locations.txt").read_text(encoding="utf-8").splitlines()
         except FileNotFoundError:
-            self.cities = []
+            lines = []
+        for line in lines:
+            display, _, city_id = line.partition("\t")
+            if display:
+                self.cities.append(display)
+                if city_id.isdigit():
+                    self.city_ids[display.lower()] = int(city_id)
+
+        # Keep the model in Qt's case-insensitive order so the completer can binary-search it
+        self.cities.sort(key=qt_fold)
 
         self.setup_ui()
         self.apply_styles()
@@ -202,22 +307,33 @@ class WeatherApp(QWidget):
         input_layout = QHBoxLayout()
 
         # 1️⃣ Create the input FIRST
-        self.city_input = CityInput(self)
+        self.city_input = QLineEdit(self)
         self.city_input.setPlaceholderText(
             "Enter locations like: London,GB; Rome,IT; New York,US"
         )
         self.city_input.setClearButtonEnabled(True)
 
-        # 2️⃣ Create the suggestion list SECOND
-        self.suggestion_list = QListWidget(self)
-        self.suggestion_list.hide()
-        self.suggestion_list.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        self.suggestion_list.itemClicked.connect(self.insert_suggestion)
-
-        # 3️⃣ Link them THIRD (now both exist)
-        self.city_input.set_suggestion_list(self.suggestion_list)
+        # 2️⃣ Create the completer SECOND; Qt does the prefix matching in C++
+        self.completer = QCompleter(QStringListModel(self.cities, self), self)
+        self.completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.completer.setFilterMode(Qt.MatchFlag.MatchStartsWith)
+        self.completer.setModelSorting(QCompleter.ModelSorting.CaseInsensitivelySortedModel)
+        self.completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
+        self.completer.setMaxVisibleItems(10)
+        self.completer.activated.connect(self.insert_suggestion)
+
+        # 3️⃣ Link them THIRD (now both exist). Not setCompleter(): that would complete the
+        # whole field, while we only complete the fragment after the last ";"
+        self.completer.setWidget(self.city_input)
         self.city_input.textEdited.connect(self.show_suggestions)
 
+        # Debounce typing so only the last keystroke in a burst rebuilds the list
+        self._pending_fragment = ""
+        self._suggest_timer = QTimer(self)
+        self._suggest_timer.setSingleShot(True)
+        self._suggest_timer.setInterval(120)
+        self._suggest_timer.timeout.connect(self._do_suggest)
+
         input_layout.addWidget(self.city_input)
 
         self.get_weather_btn = QPushButton("Get Weather")
@@ -229,7 +345,6 @@ class WeatherApp(QWidget):
         input_layout.addWidget(self.unit_toggle_btn)
 
         main_layout.addLayout(input_layout)
-        main_layout.addWidget(self.suggestion_list)
 
         # Scroll area
         self.scroll_area = QScrollArea()
@@ -287,25 +402,24 @@ class WeatherApp(QWidget):
                 color: #9fa88c;
             }
 
-            QListWidget {
+            QListView {
                 background-color: #EBD5AB;
                 color: #1B211A;
                 border: 1px solid #628141;
                 border-radius: 6px;
-                max-height: 120px;
             }
 
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #8BAE66;
                 color: #1B211A;
             }
 
-            QListWidget::item:selected:!active {
+            QListView::item:selected:!active {
                 background-color: #8BAE66;
                 color: #1B211A;
             }
 
-            QListWidget::item:hover {
+            QListView::item:hover {
                 background-color: #EBD5AB;
             }
 
@@ -316,38 +430,59 @@ class WeatherApp(QWidget):
             QLabel {
                 background: transparent;
             }
+
+            QFrame#WeatherCard {
+                background-color: #EBD5AB;
+                border-radius: 12px;
+                border: 5px solid #628141;
+                color: #1B211A;
+            }
+
+            QLabel[role="primary"], QLabel[role="stat"] {
+                color: #1B211A;
+            }
+
+            QLabel[role="desc"], QFrame[role="divider"] {
+                color: #628141;
+            }
         """)
     
     def show_suggestions(self, text):
-        fragment = text.split(";")[-1].strip().lower()
+        self._pending_fragment = text
+        # Nothing left to complete: hide stale matches now rather than after the debounce
+        if not text.split(";")[-1].strip():
+            self._suggest_timer.stop()
+            self.completer.popup().hide()
+            return
+        self._suggest_timer.start()
+
+    def _do_suggest(self):
+        fragment = self._pending_fragment.split(";")[-1].strip()
+        popup = self.completer.popup()
         if not fragment or not self.cities:
-            self.suggestion_list.hide()
+            popup.hide()
             return
 
-        matches = [
-            c for c in self.cities 
-            if c.lower().startswith(fragment)
-        ][:10]
-        self.suggestion_list.clear()
-        if matches:
-            for m in matches:
-                self.suggestion_list.addItem(QListWidgetItem(m))
-            self.suggestion_list.setCurrentRow(0)
-            self.suggestion_list.show()
+        self.completer.setCompletionPrefix(fragment)
+        if self.completer.completionCount():
+            self.completer.complete()
+            popup.setCurrentIndex(self.completer.completionModel().index(0, 0))
         else:
-            self.suggestion_list.hide()
+            popup.hide()
 
-    def insert_suggestion(self, item):
-        current_text = self.city_input.text()
+    def insert_suggestion(self, text):
         current = self.city_input.text()
 
         parts = [p.strip() for p in current.split(";") if p.strip()]
-        parts[-1] = item.text()
+        if not parts:
+            parts = [text]
+        parts[-1] = text
 
         new_text = "; ".join(parts)
         self.city_input.setText(new_text + "; ")
         self.city_input.setCursorPosition(len(self.city_input.text()))
-        self.suggestion_list.hide()
+        self._suggest_timer.stop()
+        self.completer.popup().hide()
 
     def toggle_unit(self):
         if self.unit == "metric":
@@ -371,18 +506,17 @@ class WeatherApp(QWidget):
         self.unit_toggle_btn.setEnabled(False)
 
 
-        for i in reversed(range(self.grid_layout.count())):
-            widget = self.grid_layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
+        # Swap in a fresh cards widget; setWidget() deletes the old one with all its cards
+        self.cards_widget = QWidget()
+        self.grid_layout = QGridLayout(self.cards_widget)
+        self.scroll_area.setWidget(self.cards_widget)
 
-        self.threads = []
         self.workers = []
-        self.pending_results = 0
+        self.pending_results = len(cities)
         self.any_success = False
 
-        for index, city in enumerate(cities):
-            if not re.compile(r"^[A-Za-zÀ-ÿ\s\-']+,\s*[A-Z]{2}$").match(city):
+        for city in cities:
+            if not _LOC_RE.match(city):
                 QMessageBox.warning(
                     self,
                     "Invalid format",
@@ -392,21 +526,36 @@ class WeatherApp(QWidget):
                 self.unit_toggle_btn.setEnabled(True)
                 return
 
-            thread = QThread(self)
-            worker = WeatherWorker(city, self.unit, self.api_key, index)
-            worker.moveToThread(thread)
+        # Cache hits are added synchronously, so coalesce their repaints;
+        # fetched cards still paint one by one as their results arrive
+        self.cards_widget.setUpdatesEnabled(False)
+
+        batch = []
+        for index, city in enumerate(cities):
+            key = location_key(city)
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.on_weather_result(city, cached, None, index)
+                continue
+
+            city_id = self.city_ids.get(key)
+            if city_id is not None:
+                batch.append((city, city_id, index))
+                continue
 
-            thread.started.connect(worker.run)
-            worker.finished.connect(self.on_weather_result)
-            worker.finished.connect(thread.quit)
-            worker.finished.connect(worker.deleteLater)
-            thread.finished.connect(thread.deleteLater)
+            # No unambiguous id in locations.txt: let OpenWeather resolve the name
+            self.start_worker(WeatherWorker(city, self.api_key, index))
 
-            self.threads.append(thread)
-            self.workers.append(worker)
+        self.cards_widget.setUpdatesEnabled(True)
 
-            self.pending_results += 1
-            thread.start()
+        for start in range(0, len(batch), GROUP_LIMIT):
+            self.start_worker(GroupWeatherWorker(batch[start:start + GROUP_LIMIT], self.api_key))
+
+    def start_worker(self, worker):
+        # Worker lives on the GUI thread, so its signal is queued back here from the pool
+        worker.finished.connect(self.on_weather_result)
+        self.workers.append(worker)
+        _EXECUTOR.submit(worker.run)
 
     def on_weather_result(self, city, data, error, index):
         self.pending_results -= 1
@@ -417,6 +566,7 @@ class WeatherApp(QWidget):
             QMessageBox.warning(self, "City Not Found", f"'{city}' was not found.")
         else:
             self.any_success = True
+            self.cache[location_key(city)] = data
             cols = 2
             card = WeatherCard(data, self.unit_symbol, self.unit)
             row = index // cols
@@ -431,17 +581,15 @@ class WeatherApp(QWidget):
                 QMessageBox.warning(self, "Input Error", "No valid city names to fetch.")
 
             # Cleanup
-            self.threads.clear()
             self.workers.clear()
 
 
 class WeatherWorker(QObject):
     finished = pyqtSignal(str, object, object, int)
 
-    def __init__(self, city, unit, api_key, index):
+    def __init__(self, city, api_key, index):
         super().__init__()
         self.city = city
-        self.unit = unit
         self.api_key = api_key
         self.index = index
 
@@ -451,9 +599,9 @@ class WeatherWorker(QObject):
             params = {
                 "q": self.city,
                 "appid": self.api_key,
-                "units": self.unit
+                "units": "metric"
             }
-            response = requests.get(url, params=params, timeout=5)
+            response = _SESSION.get(url, params=params, timeout=5)
 
             if response.status_code == 200: ## success
                 self.finished.emit(self.city, response.json(), None, self.index)
@@ -466,6 +614,36 @@ class WeatherWorker(QObject):
             self.finished.emit(self.city, None, e, self.index)
 
 
+class GroupWeatherWorker(QObject):
+    """Fetches up to GROUP_LIMIT cities in one call, emitting one result per city."""
+    finished = pyqtSignal(str, object, object, int)
+
+    def __init__(self, batch, api_key):
+        super().__init__()
+        self.batch = batch  # [(city, city_id, index), ...]
+        self.api_key = api_key
+
+    def run(self):
+        try:
+            url = "https://api.openweathermap.org/data/2.5/group"
+            params = {
+                "id": ",".join(str(city_id) for _, city_id, _ in self.batch),
+                "appid": self.api_key,
+                "units": "metric"
+            }
+            response = _SESSION.get(url, params=params, timeout=5)
+            response.raise_for_status()
+            by_id = {item["id"]: item for item in response.json().get("list", [])}
+
+        except Exception as e:
+            for city, _, index in self.batch:
+                self.finished.emit(city, None, e, index)
+            return
+
+        for city, city_id, index in self.batch:
+            self.finished.emit(city, by_id.get(city_id), None, index)
+
+
 
 
 if __name__ == "__main__":